@@ -1,7 +1,30 @@
 import abc
+import functools
+
+
+def cache_encoding(to_bytes):
+    """
+    Decorator for `to_bytes` of frozen APDUs. The encoded bytes are stored in the
+    `_encoded` attribute on the first call and returned directly when the same APDU
+    is sent again, as on a retransmit.
+    Only use it on APDUs where every field value is immutable as well, otherwise a
+    changed nested value would be sent with the old encoding.
+    """
+
+    @functools.wraps(to_bytes)
+    def wrapper(self) -> bytes:
+        encoded = self._encoded
+        if encoded is None:
+            encoded = to_bytes(self)
+            object.__setattr__(self, "_encoded", encoded)
+        return encoded
+
+    return wrapper
 
 
 class AbstractXDlmsApdu(abc.ABC):
+    __slots__ = ()
+
     @classmethod
     @abc.abstractmethod
     def from_bytes(cls, source_bytes: bytes):
@@ -1,61 +1,120 @@
-from typing import ClassVar
+import struct
+from typing import ClassVar, Iterator, Optional, Tuple
 
 import attr
-from dlms_cosem.protocol.xdlms.base import AbstractXDlmsApdu
+from dlms_cosem.protocol.xdlms.base import (
+    AbstractXDlmsApdu,
+    cache_encoding,
+)
 
+# tag, block-control, block-number, block-number-ack, block-data length
+_GBT_HEADER = struct.Struct(">BBHHB")
 
-@attr.s(auto_attribs=True)
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class GeneralBlockTransfer(AbstractXDlmsApdu):
     TAG: ClassVar[int] = 224
-    last_block: bool
-    streaming: bool
+    last_block: bool = attr.ib(converter=bool)
+    streaming: bool = attr.ib(converter=bool)
     window: int
     block_number: int
     block_ack: int
-    block_data: bytes
+    block_data: bytes = attr.ib(converter=bytes)
+    _encoded: Optional[bytes] = attr.ib(default=None, init=False, repr=False, eq=False)
 
-    # TODO: add attrs.validator equivalent to:
-    # assert 0 <= window < 2**6
-    # assert 0 <= block_number < 2**16
-    # assert 0 <= block_ack < 2**16
+    def __attrs_post_init__(self):
+        # Only checked in debug mode to keep parsing of many blocks cheap.
+        if __debug__:
+            if not 0 <= self.window < 2**6:
+                raise ValueError(f"window must fit in 6 bits, got {self.window}")
+            if not 0 <= self.block_number < 2**16:
+                raise ValueError(
+                    f"block_number must fit in 16 bits, got {self.block_number}"
+                )
+            if not 0 <= self.block_ack < 2**16:
+                raise ValueError(f"block_ack must fit in 16 bits, got {self.block_ack}")
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        block, end = cls._from_buffer(memoryview(source_bytes), 0)
+        if end != len(source_bytes):
+            raise ValueError(
+                f"{len(source_bytes) - end} bytes left after the end of the "
+                f"GeneralBlockTransfer"
+            )
+        return block
+
+    @classmethod
+    def iter_from_bytes(cls, source_bytes: bytes) -> Iterator["GeneralBlockTransfer"]:
+        """
+        Parses a buffer of back-to-back General Block Transfer APDUs, as received
+        when a large object is transferred in several blocks. The blocks are
+        created lazily, one at a time, as the iterator is consumed.
+        """
+        data = memoryview(source_bytes)
+        offset = 0
+        while offset < len(data):
+            block, offset = cls._from_buffer(data, offset)
+            yield block
+
+    @classmethod
+    def _from_buffer(
+        cls, data: memoryview, offset: int
+    ) -> Tuple["GeneralBlockTransfer", int]:
+        """
+        Parses the APDU starting at offset and returns it together with the offset
+        just after it.
+        """
+        if offset + _GBT_HEADER.size > len(data):
+            raise ValueError(
+                f"Data ends within the {_GBT_HEADER.size} byte header of a "
+                f"GeneralBlockTransfer"
+            )
+        tag, block_control, block_number, block_ack, length = _GBT_HEADER.unpack_from(
+            data, offset
+        )
         if tag != cls.TAG:
             raise ValueError(f"Tag is not correct. Should be {cls.TAG} but got {tag}")
 
-        block_control = data.pop(0)
-        last_block = bool(block_control & 0b10000000)
-        streaming = bool(block_control & 0b01000000)
+        # the flags are passed as 0/1, the field converters make them bool
+        last_block = (block_control >> 7) & 1
+        streaming = (block_control >> 6) & 1
         window = block_control & 0b00111111
 
-        block_number = int.from_bytes(data[:2], "big")
-        del data[:2]
-        block_ack = int.from_bytes(data[:2], "big")
-        del data[:2]
-
-        length = data.pop(0)
-        block_data = data[:length]
-        del data[:length]
-        assert not data
-
-        return cls(
-            last_block=last_block,
-            streaming=streaming,
-            window=window,
-            block_number=block_number,
-            block_ack=block_ack,
-            block_data=block_data,
+        start = offset + _GBT_HEADER.size
+        end = start + length
+        if end > len(data):
+            raise ValueError(
+                f"Block data is shorter than the indicated length of {length}"
+            )
+        block_data = bytes(data[start:end])
+
+        return (
+            cls(
+                last_block=last_block,
+                streaming=streaming,
+                window=window,
+                block_number=block_number,
+                block_ack=block_ack,
+                block_data=block_data,
+            ),
+            end,
         )
 
+    @cache_encoding
     def to_bytes(self):
+        # Checked here as well since the field checks are skipped with `python -O`
+        # and a too large window would overwrite the flag bits.
+        if not 0 <= self.window < 2**6:
+            raise ValueError(f"window must fit in 6 bits, got {self.window}")
+        block_control = self.last_block << 7 | self.streaming << 6 | self.window
         return (
-            b"\xE0"
-            + bytes([self.last_block << 7 | self.streaming << 6 | self.window])
-            + self.block_number.to_bytes(2, "big")
-            + self.block_ack.to_bytes(2, "big")
-            + len(self.block_data).to_bytes(1, "big")
+            _GBT_HEADER.pack(
+                self.TAG,
+                block_control,
+                self.block_number,
+                self.block_ack,
+                len(self.block_data),
+            )
             + self.block_data
         )
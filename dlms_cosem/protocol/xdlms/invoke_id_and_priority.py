@@ -3,7 +3,7 @@ from typing import *
 import attr
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, frozen=True)
 class InvokeIdAndPriority:
     """
     :parameter invoke_id: It is allowed to send several requests to the server (meter)
@@ -36,16 +36,30 @@ class InvokeIdAndPriority:
                 f"Should be {cls.LENGTH}, got {len(source_bytes)}"
             )
 
-        val = int.from_bytes(source_bytes, "big")
-        invoke_id = val & 0b00001111
-        confirmed = bool(val & 0b01000000)
-        high_priority = bool(val & 0b10000000)
+        return cls.from_byte(source_bytes[0])
+
+    @classmethod
+    def from_byte(cls, value: int):
+        """
+        Decodes from the integer value of the single byte, as got when indexing into
+        the APDU bytes, to avoid creating a bytes object just to decode it.
+        """
+        invoke_id = value & 0b00001111
+        confirmed = bool(value & 0b01000000)
+        high_priority = bool(value & 0b10000000)
         return cls(
             invoke_id=invoke_id, confirmed=confirmed, high_priority=high_priority
         )
 
-    def to_bytes(self) -> bytes:
+    def to_byte(self) -> int:
+        """
+        Encodes to the integer value of the single byte, for packing directly into a
+        larger APDU.
+        """
         out = self.invoke_id
         out += self.confirmed << 6
         out += self.high_priority << 7
-        return out.to_bytes(1, "big")
+        return out
+
+    def to_bytes(self) -> bytes:
+        return self.to_byte().to_bytes(1, "big")
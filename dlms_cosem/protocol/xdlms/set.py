@@ -1,10 +1,15 @@
+import enum
+import struct
 from typing import *
 
 import attr
 
 from dlms_cosem import cosem
 from dlms_cosem import enumerations as enums
-from dlms_cosem.protocol.xdlms.base import AbstractXDlmsApdu
+from dlms_cosem.protocol.xdlms.base import (
+    AbstractXDlmsApdu,
+    cache_encoding,
+)
 from dlms_cosem.protocol.xdlms.invoke_id_and_priority import InvokeIdAndPriority
 from dlms_cosem.dlms_data import (
     decode_variable_integer,
@@ -31,8 +36,59 @@ set-response-with-list                  [5] IMPLICIT Set-Response-With-List
 }
 """
 
+_E = TypeVar("_E", bound=enum.Enum)
 
-@attr.s(auto_attribs=True)
+# tag, request/response type, invoke-id-and-priority
+_SET_HEADER = struct.Struct(">BBB")
+# last-block, block-number of a DataBlock-SA
+_DATABLOCK_SA_HEADER = struct.Struct(">BI")
+
+
+def _with_tag_and_type(body: struct.Struct) -> struct.Struct:
+    """Returns the Struct of a whole APDU: the tag and type followed by the body."""
+    return struct.Struct(">BB" + body.format.lstrip(">"))
+
+
+# The fixed layout responses following the tag and type, parsed in a single unpack.
+# invoke-id-and-priority, result
+_SET_RESPONSE_NORMAL_BODY = struct.Struct(">BB")
+_SET_RESPONSE_NORMAL = _with_tag_and_type(_SET_RESPONSE_NORMAL_BODY)
+# invoke-id-and-priority, block-number
+_SET_RESPONSE_WITH_BLOCK_BODY = struct.Struct(">BI")
+_SET_RESPONSE_WITH_BLOCK = _with_tag_and_type(_SET_RESPONSE_WITH_BLOCK_BODY)
+# invoke-id-and-priority, result, block-number
+_SET_RESPONSE_LAST_BLOCK_BODY = struct.Struct(">BBI")
+_SET_RESPONSE_LAST_BLOCK = _with_tag_and_type(_SET_RESPONSE_LAST_BLOCK_BODY)
+
+
+def _to_enum(enum_class: Type[_E], value: int) -> _E:
+    """
+    Looks the member up directly in the value map of the enum, which is cheaper than
+    calling the enum class. Unknown values fall back to the enum call so they raise
+    the usual ValueError.
+    """
+    member = enum_class._value2member_map_.get(value)
+    if member is None:
+        return enum_class(value)
+    return member
+
+
+def _check_types(instance: Any, **expected_types: type):
+    """
+    Type check of the fields of an APDU. It is called from __attrs_post_init__
+    under `if __debug__:`, instead of using attrs validators, so it is skipped
+    when running with `python -O`.
+    """
+    for name, expected_type in expected_types.items():
+        value = getattr(instance, name)
+        if not isinstance(value, expected_type):
+            raise TypeError(
+                f"'{name}' must be {expected_type!r} (got {value!r} that is a "
+                f"{value.__class__!r})."
+            )
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class SetRequestNormal(AbstractXDlmsApdu):
     """
     Set-Request-Normal ::= SEQUENCE
@@ -46,36 +102,42 @@ class SetRequestNormal(AbstractXDlmsApdu):
 
     TAG: ClassVar[int] = 193
     RESPONSE_TYPE: ClassVar[enums.SetRequestType] = enums.SetRequestType.NORMAL
-    cosem_attribute: cosem.CosemAttribute = attr.ib(
-        validator=attr.validators.instance_of(cosem.CosemAttribute)
-    )
-    data: bytes = attr.ib(validator=attr.validators.instance_of(bytes))
+    _TYPE_BYTE: ClassVar[int] = RESPONSE_TYPE.value
+    cosem_attribute: cosem.CosemAttribute
+    data: bytes
     access_selection: Optional[Any] = attr.ib(default=None)
-    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(
-        factory=InvokeIdAndPriority,
-        validator=attr.validators.instance_of(InvokeIdAndPriority),
-    )
+    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(factory=InvokeIdAndPriority)
+
+    def __attrs_post_init__(self):
+        if __debug__:
+            _check_types(
+                self,
+                cosem_attribute=cosem.CosemAttribute,
+                data=bytes,
+                invoke_id_and_priority=InvokeIdAndPriority,
+            )
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        tag = data[0]
         if tag != cls.TAG:
             raise ValueError(
                 f"Tag for SetRequest is not correct. Got {tag}, should be {cls.TAG}"
             )
 
-        type_choice = enums.SetRequestType(data.pop(0))
-        if type_choice is not enums.SetRequestType.NORMAL:
+        if data[1] != cls._TYPE_BYTE:
             raise ValueError("The type of the SetRequest is not for a SetRequestNormal")
 
-        invoke_id_and_priority = InvokeIdAndPriority.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
-        cosem_attribute = cosem.CosemAttribute.from_bytes(data[:9])
-        data = data[9:]
+        return cls._from_body(data[2:])
 
-        has_access_selection = bool(data.pop(0))
+    @classmethod
+    def _from_body(cls, data: memoryview):
+        """Parses the APDU content following the already validated tag and type."""
+        invoke_id_and_priority = InvokeIdAndPriority.from_byte(data[0])
+        cosem_attribute = cosem.CosemAttribute.from_bytes(bytes(data[1:10]))
+
+        has_access_selection = bool(data[10])
         if has_access_selection:
             raise NotImplementedError("Selective access on SET is not implemented")
         else:
@@ -83,27 +145,31 @@ class SetRequestNormal(AbstractXDlmsApdu):
 
         return cls(
             cosem_attribute=cosem_attribute,
-            data=bytes(data),
+            data=bytes(data[11:]),
             access_selection=access_selection,
             invoke_id_and_priority=invoke_id_and_priority,
         )
 
     def to_bytes(self) -> bytes:
-        out = bytearray()
-        out.append(self.TAG)
-        out.append(self.RESPONSE_TYPE.value)
-        out.extend(self.invoke_id_and_priority.to_bytes())
-        out.extend(self.cosem_attribute.to_bytes())
         if self.access_selection:
-            out.extend(b"\x01")
-            out.extend(self.access_selection.to_bytes())
+            access_selection = b"\x01" + self.access_selection.to_bytes()
         else:
-            out.extend(b"\x00")
-        out.extend(self.data)
-        return bytes(out)
+            access_selection = b"\x00"
+        return b"".join(
+            (
+                _SET_HEADER.pack(
+                    self.TAG,
+                    self._TYPE_BYTE,
+                    self.invoke_id_and_priority.to_byte(),
+                ),
+                self.cosem_attribute.to_bytes(),
+                access_selection,
+                self.data,
+            )
+        )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class SetRequestWithFirstBlock(AbstractXDlmsApdu):
     """
     Set-Request-With-First-Datablock ::= SEQUENCE
@@ -124,58 +190,61 @@ class SetRequestWithFirstBlock(AbstractXDlmsApdu):
 
     TAG: ClassVar[int] = 193
     RESPONSE_TYPE: ClassVar[enums.SetRequestType] = enums.SetRequestType.WITH_FIRST_BLOCK
-    cosem_attribute: cosem.CosemAttribute = attr.ib(
-        validator=attr.validators.instance_of(cosem.CosemAttribute)
-    )
-    data: bytes = attr.ib(validator=attr.validators.instance_of(bytes))
+    _TYPE_BYTE: ClassVar[int] = RESPONSE_TYPE.value
+    cosem_attribute: cosem.CosemAttribute
+    data: bytes
     access_selection: Optional[Any] = attr.ib(default=None)
-    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(
-        factory=InvokeIdAndPriority,
-        validator=attr.validators.instance_of(InvokeIdAndPriority),
-    )
+    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(factory=InvokeIdAndPriority)
+
+    def __attrs_post_init__(self):
+        if __debug__:
+            _check_types(
+                self,
+                cosem_attribute=cosem.CosemAttribute,
+                data=bytes,
+                invoke_id_and_priority=InvokeIdAndPriority,
+            )
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        tag = data[0]
         if tag != cls.TAG:
             raise ValueError(
                 f"Tag for SetRequest is not correct. Got {tag}, should be {cls.TAG}"
             )
 
-        type_choice = enums.SetRequestType(data.pop(0))
-        if type_choice is not enums.SetRequestType.WITH_FIRST_BLOCK:
+        if data[1] != cls._TYPE_BYTE:
             raise ValueError("The type of the SetRequest is not for a SetRequestWithFirstBlock")
 
-        invoke_id_and_priority = InvokeIdAndPriority.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
-        cosem_attribute = cosem.CosemAttribute.from_bytes(data[:9])
-        data = data[9:]
+        return cls._from_body(data[2:])
 
-        has_access_selection = bool(data.pop(0))
+    @classmethod
+    def _from_body(cls, data: memoryview):
+        """Parses the APDU content following the already validated tag and type."""
+        invoke_id_and_priority = InvokeIdAndPriority.from_byte(data[0])
+        cosem_attribute = cosem.CosemAttribute.from_bytes(bytes(data[1:10]))
+
+        has_access_selection = bool(data[10])
         if has_access_selection:
             raise NotImplementedError("Selective access on SET is not implemented")
         else:
             access_selection = None
 
-        last_block = bool(data.pop(0))
+        last_block, block_number = _DATABLOCK_SA_HEADER.unpack_from(data, 11)
         if last_block:
             raise ValueError(
                 f"Last block set to true in a SetRequestWithFirstBlock. Should only be set "
                 f"for a SetRequestWithBlock"
             )
 
-        block_number = int.from_bytes(data[:4], "big")
         if block_number !=1:
             raise ValueError(
                 "block_number should be 1 in a SetRequestWithFirstBlock. "
                 f"Instead received {block_number}"
             )
 
-        data = data[4:]
-
-        data_length, data = decode_variable_integer(data)
+        data_length, data = decode_variable_integer(data[16:])
         if data_length != len(data):
             raise ValueError(
                 "The octet string in block data is not of the correct length"
@@ -189,21 +258,25 @@ class SetRequestWithFirstBlock(AbstractXDlmsApdu):
         )
 
     def to_bytes(self) -> bytes:
-        out = bytearray()
-        out.append(self.TAG)
-        out.append(self.RESPONSE_TYPE.value)
-        out.extend(self.invoke_id_and_priority.to_bytes())
-        out.extend(self.cosem_attribute.to_bytes())
         if self.access_selection:
-            out.extend(b"\x01")
-            out.extend(self.access_selection.to_bytes())
+            access_selection = b"\x01" + self.access_selection.to_bytes()
         else:
-            out.extend(b"\x00")
-        out.append(0) # last_block
-        out.extend(b'\x00\x00\x00\x01') # block number
-        out.extend(encode_variable_integer(len(self.data)))
-        out.extend(self.data)
-        return bytes(out)
+            access_selection = b"\x00"
+        return b"".join(
+            (
+                _SET_HEADER.pack(
+                    self.TAG,
+                    self._TYPE_BYTE,
+                    self.invoke_id_and_priority.to_byte(),
+                ),
+                self.cosem_attribute.to_bytes(),
+                access_selection,
+                # the first block is never the last and is always block number 1
+                _DATABLOCK_SA_HEADER.pack(0, 1),
+                encode_variable_integer(len(self.data)),
+                self.data,
+            )
+        )
 
 
 @attr.s(auto_attribs=True)
@@ -281,28 +354,68 @@ class SetRequestFactory:
     """
 
     TAG: ClassVar[int] = 193
+    _DISPATCH: ClassVar[Dict[enums.SetRequestType, Type[AbstractXDlmsApdu]]] = {
+        enums.SetRequestType.NORMAL: SetRequestNormal,
+        enums.SetRequestType.WITH_FIRST_BLOCK: SetRequestWithFirstBlock,
+    }
 
     @staticmethod
     def from_bytes(source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        request_class = SetRequestFactory._get_request_class(data, 0)
+        return request_class._from_body(data[2:])
+
+    @staticmethod
+    def parse_many(source_bytes: bytes, lengths: Iterable[int]) -> List[Any]:
+        """
+        Parses several SetRequests received back-to-back in one buffer.
+        A SetRequest does not carry its own length so the length of each request
+        must be supplied, for example from the wrapper headers.
+        """
+        data = memoryview(source_bytes)
+        requests = list()
+        offset = 0
+        for length in lengths:
+            end = offset + length
+            if end > len(data):
+                raise ValueError(
+                    f"Buffer of {len(data)} bytes is too short for a SetRequest "
+                    f"ending at {end}"
+                )
+            request_class = SetRequestFactory._get_request_class(data[:end], offset)
+            requests.append(request_class._from_body(data[offset + 2 : end]))
+            offset = end
+
+        if offset != len(data):
+            raise ValueError(
+                f"{len(data) - offset} bytes left in the buffer after the last "
+                f"SetRequest"
+            )
+
+        return requests
+
+    @staticmethod
+    def _get_request_class(data: memoryview, offset: int):
+        """
+        Validates the tag and type of the SetRequest starting at offset and returns
+        the class that parses it.
+        """
+        if offset + 2 > len(data):
+            raise ValueError("Data ends before the tag and type of a SetRequest")
+        tag = data[offset]
         if tag != SetRequestFactory.TAG:
             raise ValueError(
-                f"Tag for GET request is not correct. Got {tag}, should be "
+                f"Tag for SetRequest is not correct. Got {tag}, should be "
                 f"{SetRequestFactory.TAG}"
             )
-        request_type = enums.SetRequestType(data.pop(0))
-        if request_type == enums.SetRequestType.NORMAL:
-            return SetRequestNormal.from_bytes(source_bytes)
-        elif request_type == enums.SetRequestType.WITH_FIRST_BLOCK:
-            return SetRequestWithFirstBlock.from_bytes(source_bytes)
-        elif request_type == enums.SetRequestType.WITH_BLOCK:
-            return SetRequestWithBlock.from_bytes(source_bytes)
-        else:
-            raise NotImplementedError("Unsupported set subtype: {request_type}")
+        request_type = _to_enum(enums.SetRequestType, data[offset + 1])
+        request_class = SetRequestFactory._DISPATCH.get(request_type)
+        if request_class is None:
+            raise NotImplementedError(f"Unsupported set subtype: {request_type}")
+        return request_class
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class SetResponseNormal(AbstractXDlmsApdu):
     """
     Set-Response-Normal ::= SEQUENCE
@@ -314,47 +427,62 @@ class SetResponseNormal(AbstractXDlmsApdu):
 
     TAG: ClassVar[int] = 197
     RESPONSE_TYPE: ClassVar[enums.SetResponseType] = enums.SetResponseType.NORMAL
-    result: enums.DataAccessResult = attr.ib(
-        validator=attr.validators.instance_of(enums.DataAccessResult)
-    )
-    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(
-        factory=InvokeIdAndPriority,
-        validator=attr.validators.instance_of(InvokeIdAndPriority),
-    )
+    _TYPE_BYTE: ClassVar[int] = RESPONSE_TYPE.value
+    LENGTH: ClassVar[int] = _SET_RESPONSE_NORMAL.size
+    result: enums.DataAccessResult
+    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(factory=InvokeIdAndPriority)
+    _encoded: Optional[bytes] = attr.ib(default=None, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        if __debug__:
+            _check_types(
+                self,
+                result=enums.DataAccessResult,
+                invoke_id_and_priority=InvokeIdAndPriority,
+            )
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        tag = data[0]
         if tag != cls.TAG:
             raise ValueError(
                 f"Tag for SetResponse is not correct. Got {tag}, should be {cls.TAG}"
             )
 
-        type_choice = enums.SetResponseType(data.pop(0))
-        if type_choice is not enums.SetResponseType.NORMAL:
+        if data[1] != cls._TYPE_BYTE:
             raise ValueError(
                 "The type of the SetResponse is not for a SetResponseNormal"
             )
 
-        invoke_id_and_priority = InvokeIdAndPriority.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
+        if len(data) < cls.LENGTH:
+            raise ValueError(
+                f"Buffer ends before the end of the {cls.__name__}"
+            )
 
-        result = enums.DataAccessResult(data.pop(0))
+        return cls._from_body(data[2:])
 
-        return cls(result=result, invoke_id_and_priority=invoke_id_and_priority)
+    @classmethod
+    def _from_body(cls, data: memoryview):
+        """Parses the APDU content following the already validated tag and type."""
+        invoke_id_byte, result = _SET_RESPONSE_NORMAL_BODY.unpack_from(data)
+        invoke_id_and_priority = InvokeIdAndPriority.from_byte(invoke_id_byte)
+        return cls(
+            result=_to_enum(enums.DataAccessResult, result),
+            invoke_id_and_priority=invoke_id_and_priority,
+        )
 
+    @cache_encoding
     def to_bytes(self) -> bytes:
-        out = bytearray()
-        out.append(self.TAG)
-        out.append(self.RESPONSE_TYPE.value)
-        out.extend(self.invoke_id_and_priority.to_bytes())
-        out.append(self.result.value)
-        return bytes(out)
+        return _SET_RESPONSE_NORMAL.pack(
+            self.TAG,
+            self._TYPE_BYTE,
+            self.invoke_id_and_priority.to_byte(),
+            self.result.value,
+        )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class SetResponseWithBlock(AbstractXDlmsApdu):
     """
     Set-Response-Datablock ::= SEQUENCE
@@ -366,45 +494,80 @@ class SetResponseWithBlock(AbstractXDlmsApdu):
 
     TAG: ClassVar[int] = 197
     RESPONSE_TYPE: ClassVar[enums.SetResponseType] = enums.SetResponseType.WITH_BLOCK
-    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(
-        factory=InvokeIdAndPriority,
-        validator=attr.validators.instance_of(InvokeIdAndPriority),
-    )
-    block_number: int = attr.ib(validator=attr.validators.instance_of(int), default=0)
+    _TYPE_BYTE: ClassVar[int] = RESPONSE_TYPE.value
+    LENGTH: ClassVar[int] = _SET_RESPONSE_WITH_BLOCK.size
+    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(factory=InvokeIdAndPriority)
+    block_number: int = attr.ib(default=0)
+    _encoded: Optional[bytes] = attr.ib(default=None, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        if __debug__:
+            _check_types(
+                self,
+                invoke_id_and_priority=InvokeIdAndPriority,
+                block_number=int,
+            )
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        tag = data[0]
         if tag != cls.TAG:
             raise ValueError(
                 f"Tag for SetResponse is not correct. Got {tag}, should be {cls.TAG}"
             )
 
-        type_choice = enums.SetResponseType(data.pop(0))
-        if type_choice is not enums.SetResponseType.WITH_BLOCK:
+        if data[1] != cls._TYPE_BYTE:
             raise ValueError(
                 "The type of the SetResponse is not for a SetResponseWithBlock"
             )
 
-        invoke_id_and_priority = InvokeIdAndPriority.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
+        if len(data) < cls.LENGTH:
+            raise ValueError(
+                f"Buffer ends before the end of the {cls.__name__}"
+            )
 
-        block_number = int.from_bytes(data[:4], "big")
+        return cls._from_body(data[2:])
 
-        return cls(invoke_id_and_priority=invoke_id_and_priority, block_number=block_number)
+    @classmethod
+    def _from_body(cls, data: memoryview):
+        """Parses the APDU content following the already validated tag and type."""
+        invoke_id_byte, block_number = _SET_RESPONSE_WITH_BLOCK_BODY.unpack_from(data)
+        invoke_id_and_priority = InvokeIdAndPriority.from_byte(invoke_id_byte)
+        return cls(
+            invoke_id_and_priority=invoke_id_and_priority,
+            block_number=block_number,
+        )
 
+    @cache_encoding
     def to_bytes(self) -> bytes:
-        out = bytearray()
-        out.append(self.TAG)
-        out.append(self.RESPONSE_TYPE.value)
-        out.extend(self.invoke_id_and_priority.to_bytes())
-        out.extend(self.block_number.to_bytes(4, 'big'))
+        return _SET_RESPONSE_WITH_BLOCK.pack(
+            self.TAG,
+            self._TYPE_BYTE,
+            self.invoke_id_and_priority.to_byte(),
+            self.block_number,
+        )
+
+    @classmethod
+    def encode_many(cls, responses: Sequence["SetResponseWithBlock"]) -> bytes:
+        """
+        Encodes the acknowledgements of several received blocks, as sent in a
+        windowed block transfer, into one buffer that is allocated once.
+        """
+        out = bytearray(len(responses) * cls.LENGTH)
+        for index, response in enumerate(responses):
+            _SET_RESPONSE_WITH_BLOCK.pack_into(
+                out,
+                index * cls.LENGTH,
+                cls.TAG,
+                cls._TYPE_BYTE,
+                response.invoke_id_and_priority.to_byte(),
+                response.block_number,
+            )
         return bytes(out)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class SetResponseLastBlock(AbstractXDlmsApdu):
     """
     Set-Response-Last-Datablock ::= SEQUENCE
@@ -417,47 +580,64 @@ class SetResponseLastBlock(AbstractXDlmsApdu):
 
     TAG: ClassVar[int] = 197
     RESPONSE_TYPE: ClassVar[enums.SetResponseType] = enums.SetResponseType.WITH_LAST_BLOCK
-    result: enums.DataAccessResult = attr.ib(
-        validator=attr.validators.instance_of(enums.DataAccessResult)
-    )
-    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(
-        factory=InvokeIdAndPriority,
-        validator=attr.validators.instance_of(InvokeIdAndPriority),
-    )
-    block_number: int = attr.ib(validator=attr.validators.instance_of(int), default=0)
+    _TYPE_BYTE: ClassVar[int] = RESPONSE_TYPE.value
+    LENGTH: ClassVar[int] = _SET_RESPONSE_LAST_BLOCK.size
+    result: enums.DataAccessResult
+    invoke_id_and_priority: InvokeIdAndPriority = attr.ib(factory=InvokeIdAndPriority)
+    block_number: int = attr.ib(default=0)
+    _encoded: Optional[bytes] = attr.ib(default=None, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        if __debug__:
+            _check_types(
+                self,
+                result=enums.DataAccessResult,
+                invoke_id_and_priority=InvokeIdAndPriority,
+                block_number=int,
+            )
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        tag = data[0]
         if tag != cls.TAG:
             raise ValueError(
                 f"Tag for SetResponse is not correct. Got {tag}, should be {cls.TAG}"
             )
 
-        type_choice = enums.SetResponseType(data.pop(0))
-        if type_choice is not enums.SetResponseType.WITH_LAST_BLOCK:
+        if data[1] != cls._TYPE_BYTE:
             raise ValueError(
                 "The type of the SetResponse is not for a SetResponseLastBlock"
             )
 
-        invoke_id_and_priority = InvokeIdAndPriority.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
+        if len(data) < cls.LENGTH:
+            raise ValueError(
+                f"Buffer ends before the end of the {cls.__name__}"
+            )
 
-        result = enums.DataAccessResult(data.pop(0))
-        block_number = int.from_bytes(data[:4], "big")
+        return cls._from_body(data[2:])
 
-        return cls(result=result, invoke_id_and_priority=invoke_id_and_priority, block_number=block_number)
+    @classmethod
+    def _from_body(cls, data: memoryview):
+        """Parses the APDU content following the already validated tag and type."""
+        body = _SET_RESPONSE_LAST_BLOCK_BODY.unpack_from(data)
+        invoke_id_byte, result, block_number = body
+        invoke_id_and_priority = InvokeIdAndPriority.from_byte(invoke_id_byte)
+        return cls(
+            result=_to_enum(enums.DataAccessResult, result),
+            invoke_id_and_priority=invoke_id_and_priority,
+            block_number=block_number,
+        )
 
+    @cache_encoding
     def to_bytes(self) -> bytes:
-        out = bytearray()
-        out.append(self.TAG)
-        out.append(self.RESPONSE_TYPE.value)
-        out.extend(self.invoke_id_and_priority.to_bytes())
-        out.append(self.result.value)
-        out.extend(self.block_number.to_bytes(4, 'big'))
-        return bytes(out)
+        return _SET_RESPONSE_LAST_BLOCK.pack(
+            self.TAG,
+            self._TYPE_BYTE,
+            self.invoke_id_and_priority.to_byte(),
+            self.result.value,
+            self.block_number,
+        )
 
 
 @attr.s(auto_attribs=True)
@@ -494,22 +674,60 @@ class SetResponseFactory:
     """
 
     TAG: ClassVar[int] = 197
+    _DISPATCH: ClassVar[Dict[enums.SetResponseType, Type[AbstractXDlmsApdu]]] = {
+        enums.SetResponseType.NORMAL: SetResponseNormal,
+        enums.SetResponseType.WITH_BLOCK: SetResponseWithBlock,
+        enums.SetResponseType.WITH_LAST_BLOCK: SetResponseLastBlock,
+    }
 
     @staticmethod
     def from_bytes(source_bytes: bytes):
-        data = bytearray(source_bytes)
-        tag = data.pop(0)
+        data = memoryview(source_bytes)
+        response_class = SetResponseFactory._get_response_class(data, 0)
+        if len(data) < response_class.LENGTH:
+            raise ValueError(
+                f"Buffer ends before the end of the {response_class.__name__}"
+            )
+        return response_class._from_body(data[2:])
+
+    @staticmethod
+    def parse_many(source_bytes: bytes) -> List[Any]:
+        """
+        Parses several SetResponses received back-to-back in one buffer, for
+        example the acknowledgements of a windowed block transfer. All the
+        supported SetResponses have a fixed length so no framing is needed.
+        """
+        data = memoryview(source_bytes)
+        responses = list()
+        offset = 0
+        while offset < len(data):
+            response_class = SetResponseFactory._get_response_class(data, offset)
+            end = offset + response_class.LENGTH
+            if end > len(data):
+                raise ValueError(
+                    f"Buffer ends before the end of the {response_class.__name__}"
+                )
+            responses.append(response_class._from_body(data[offset + 2 : end]))
+            offset = end
+
+        return responses
+
+    @staticmethod
+    def _get_response_class(data: memoryview, offset: int):
+        """
+        Validates the tag and type of the SetResponse starting at offset and returns
+        the class that parses it.
+        """
+        if offset + 2 > len(data):
+            raise ValueError("Data ends before the tag and type of a Set response")
+        tag = data[offset]
         if tag != SetResponseFactory.TAG:
             raise ValueError(
                 f"Tag for Set response is not correct. Got {tag}, should be "
                 f"{SetResponseFactory.TAG}"
             )
-        request_type = enums.SetResponseType(data.pop(0))
-        if request_type == enums.SetResponseType.NORMAL:
-            return SetResponseNormal.from_bytes(source_bytes)
-        elif request_type == enums.SetResponseType.WITH_BLOCK:
-            return SetResponseWithBlock.from_bytes(source_bytes)
-        elif request_type == enums.SetResponseType.WITH_LAST_BLOCK:
-            return SetResponseLastBlock.from_bytes(source_bytes)
-        else:
-            raise NotImplementedError(f"not implemented {request_type}")
+        response_type = _to_enum(enums.SetResponseType, data[offset + 1])
+        response_class = SetResponseFactory._DISPATCH.get(response_type)
+        if response_class is None:
+            raise NotImplementedError(f"not implemented {response_type}")
+        return response_class
@@ -1,3 +1,5 @@
+import pytest
+
 from dlms_cosem.protocol.xdlms.general_block_transfer import GeneralBlockTransfer
 
 
@@ -20,3 +22,89 @@ def test_generate_gbt():
     )
     assert (pdu) == parsed.to_bytes()
     assert parsed == GeneralBlockTransfer.from_bytes(pdu)
+
+
+def test_trailing_data_raises_value_error():
+    with pytest.raises(ValueError):
+        GeneralBlockTransfer.from_bytes(b"\xe0\x81\x00\x01\x00\x00\x01ab")
+
+
+def test_iter_gbt_stream():
+    blocks = [
+        GeneralBlockTransfer(
+            last_block=False,
+            streaming=True,
+            window=2,
+            block_number=1,
+            block_ack=0,
+            block_data=b"abc",
+        ),
+        GeneralBlockTransfer(
+            last_block=True,
+            streaming=True,
+            window=2,
+            block_number=2,
+            block_ack=0,
+            block_data=b"de",
+        ),
+    ]
+    stream = b"".join(block.to_bytes() for block in blocks)
+    assert list(GeneralBlockTransfer.iter_from_bytes(stream)) == blocks
+
+
+def test_iter_gbt_stream_with_truncated_block_raises_value_error():
+    stream = b"\xE0\x81\x00\x01\x00\x00\x03abc" + b"\xE0\x82\x00\x02\x00\x00\x03ab"
+    with pytest.raises(ValueError):
+        list(GeneralBlockTransfer.iter_from_bytes(stream))
+
+
+def test_iter_gbt_stream_with_truncated_header_raises_value_error():
+    stream = b"\xe0\x81\x00\x01\x00\x00\x01a" + b"\xe0\x81"
+    with pytest.raises(ValueError):
+        list(GeneralBlockTransfer.iter_from_bytes(stream))
+
+
+def test_encoding_is_cached():
+    gbt = GeneralBlockTransfer(
+        last_block=True,
+        streaming=False,
+        window=1,
+        block_number=1,
+        block_ack=0,
+        block_data=b"abc",
+    )
+    assert gbt.to_bytes() is gbt.to_bytes()
+    assert gbt == GeneralBlockTransfer.from_bytes(gbt.to_bytes())
+
+
+def test_bytearray_block_data_is_copied_to_bytes():
+    block_data = bytearray(b"abc")
+    gbt = GeneralBlockTransfer(
+        last_block=True,
+        streaming=False,
+        window=1,
+        block_number=1,
+        block_ack=0,
+        block_data=block_data,
+    )
+    encoded = gbt.to_bytes()
+    block_data[0] = 0x7A
+    assert isinstance(gbt.block_data, bytes)
+    assert gbt.block_data == b"abc"
+    assert gbt.to_bytes() == encoded == b"\xe0\x81\x00\x01\x00\x00\x03abc"
+
+
+@pytest.mark.skipif(not __debug__, reason="field checks only run in debug mode")
+@pytest.mark.parametrize(
+    "window, block_number, block_ack", [(64, 1, 0), (1, 2**16, 0), (1, 1, -1)]
+)
+def test_out_of_range_field_raises_value_error(window, block_number, block_ack):
+    with pytest.raises(ValueError):
+        GeneralBlockTransfer(
+            last_block=True,
+            streaming=False,
+            window=window,
+            block_number=block_number,
+            block_ack=block_ack,
+            block_data=b"abc",
+        )
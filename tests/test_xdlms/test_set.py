@@ -73,6 +73,38 @@ class TestSetRequestFactory:
         with pytest.raises(NotImplementedError):
             xdlms.SetRequestFactory.from_bytes(data)
 
+    @pytest.mark.parametrize(
+        "data",
+        [b"\xc5\x01\xc1", b"\xc5\x02\xc1\x00\x00", b"\xc5\x03\xc1\x00\x00\x00"],
+    )
+    def test_truncated_response_raises_value_error(self, data):
+        with pytest.raises(ValueError):
+            xdlms.SetResponseFactory.from_bytes(data)
+
+    def test_parse_many(self):
+        normal = b"\xc1\x01\xc1\x00\x08\x00\x00\x01\x00\x00\xff\x02\x00\t\x0c\x07\xe5\x01\x18\xff\x0e09P\xff\xc4\x00"
+        first_block = bytes.fromhex(
+            "C102C1"
+            "00010000800000FF0200"
+            "00"
+            "00000001"
+            "15"
+            "09320102030405060708091011121314"
+            "1516171819"
+        )
+        requests = xdlms.SetRequestFactory.parse_many(
+            normal + first_block, [len(normal), len(first_block)]
+        )
+        assert requests == [
+            xdlms.SetRequestNormal.from_bytes(normal),
+            xdlms.SetRequestWithFirstBlock.from_bytes(first_block),
+        ]
+
+    def test_parse_many_with_bytes_left_raises_value_error(self):
+        normal = b"\xc1\x01\xc1\x00\x08\x00\x00\x01\x00\x00\xff\x02\x00\t\x0c\x07\xe5\x01\x18\xff\x0e09P\xff\xc4\x00"
+        with pytest.raises(ValueError):
+            xdlms.SetRequestFactory.parse_many(normal + normal, [len(normal)])
+
 
 class TestSetResponseNormal:
     def test_transform_bytes(self):
@@ -91,6 +123,26 @@ class TestSetResponseNormal:
         with pytest.raises(ValueError):
             xdlms.SetRequestNormal.from_bytes(data)
 
+    @pytest.mark.skipif(not __debug__, reason="type checks only run in debug mode")
+    def test_wrong_result_type_raises_type_error(self):
+        with pytest.raises(TypeError):
+            xdlms.SetResponseNormal(result=0)
+
+    def test_is_immutable(self):
+        response = xdlms.SetResponseNormal(
+            result=enumerations.DataAccessResult.SUCCESS
+        )
+        with pytest.raises(AttributeError):
+            response.result = enumerations.DataAccessResult.HARDWARE_FAULT
+        with pytest.raises(AttributeError):
+            response.invoke_id_and_priority.invoke_id = 5
+
+    def test_encoding_is_cached(self):
+        response = xdlms.SetResponseNormal(
+            result=enumerations.DataAccessResult.SUCCESS
+        )
+        assert response.to_bytes() is response.to_bytes()
+
     def test_wrong_type_raises_value_error(self):
         data = b"\xc5\x02\xc1\x00"
         with pytest.raises(ValueError):
@@ -109,12 +161,12 @@ class TestSetResponseFactory:
             xdlms.SetResponseFactory.from_bytes(data)
 
     def test_set_response_with_block(self):
-        data = b"\xc5\x02\xc1\x00"
+        data = b"\xc5\x02\xc1\x00\x00\x00\x01"
         request = xdlms.SetResponseFactory.from_bytes(data)
         assert isinstance(request, xdlms.SetResponseWithBlock)
 
     def test_set_response_last_block(self):
-        data = b"\xc5\x03\xc1\x00"
+        data = b"\xc5\x03\xc1\x00\x00\x00\x00\x02"
         request = xdlms.SetResponseFactory.from_bytes(data)
         assert isinstance(request, xdlms.SetResponseLastBlock)
 
@@ -128,6 +180,28 @@ class TestSetResponseFactory:
         with pytest.raises(NotImplementedError):
             xdlms.SetResponseFactory.from_bytes(data)
 
+    def test_parse_many(self):
+        data = bytes.fromhex("C502C100000001" "C502C100000002" "C503C10000000003")
+        responses = xdlms.SetResponseFactory.parse_many(data)
+        assert responses == [
+            xdlms.SetResponseWithBlock(block_number=1),
+            xdlms.SetResponseWithBlock(block_number=2),
+            xdlms.SetResponseLastBlock(
+                result=enumerations.DataAccessResult.SUCCESS, block_number=3
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            bytes.fromhex("C502C100000001" "C503C1000000"),
+            bytes.fromhex("C502C100000001" "C5"),
+        ],
+    )
+    def test_parse_many_with_truncated_response_raises_value_error(self, data):
+        with pytest.raises(ValueError):
+            xdlms.SetResponseFactory.parse_many(data)
+
 
 class TestSetRequestWithFirstBlock:
     def test_transform_bytes(self):
@@ -156,6 +230,17 @@ class TestSetRequestWithFirstBlock:
         assert data == request.to_bytes()
         assert request == xdlms.SetRequestWithFirstBlock.from_bytes(data)
 
+    def test_transform_bytes_large_payload(self):
+        request = xdlms.SetRequestWithFirstBlock(
+            cosem_attribute=cosem.CosemAttribute(
+                interface=enumerations.CosemInterface.DATA,
+                instance=cosem.Obis(a=0, b=0, c=128, d=0, e=0, f=255),
+                attribute=2,
+            ),
+            data=b"\x01" * 10000,
+        )
+        assert request == xdlms.SetRequestWithFirstBlock.from_bytes(request.to_bytes())
+
 
 class TestSetResponseWithBlock:
     def test_transform_bytes(self):
@@ -170,6 +255,15 @@ class TestSetResponseWithBlock:
         assert data == response.to_bytes()
         assert response == xdlms.SetResponseWithBlock.from_bytes(data)
 
+    def test_encode_many(self):
+        responses = [
+            xdlms.SetResponseWithBlock(block_number=block_number)
+            for block_number in range(1, 4)
+        ]
+        data = xdlms.SetResponseWithBlock.encode_many(responses)
+        assert data == b"".join(response.to_bytes() for response in responses)
+        assert xdlms.SetResponseFactory.parse_many(data) == responses
+
 
 class TestSetResponseLastBlock:
     def test_transform_bytes(self):
@@ -184,3 +278,7 @@ class TestSetResponseLastBlock:
         )
         assert data == response.to_bytes()
         assert response == xdlms.SetResponseLastBlock.from_bytes(data)
+
+    def test_truncated_response_raises_value_error(self):
+        with pytest.raises(ValueError):
+            xdlms.SetResponseLastBlock.from_bytes(bytes.fromhex("C503C1000000"))